@@ -1,15 +1,20 @@
 import json
 import requests
-from typing import Union, Dict, Any, List
+from typing import Dict, Any, List
 
-from ..utils import get_logger
+from ..utils import get_logger, parse_dataset_response
 from ..exceptions import ValidationError, APIError, AuthenticationError
 
 logger = get_logger('api.chatgpt')
 
 
 class ChatGPTAPI:
-    """Handles ChatGPT scraping operations using Bright Data's ChatGPT dataset API"""
+    """
+    Handles ChatGPT scraping operations using Bright Data's ChatGPT dataset API
+    
+    Requests are sent with the given session as-is, so it must already carry
+    the Authorization header (bdclient sets it); api_token is not read.
+    """
     
     def __init__(self, session, api_token, default_timeout=30, max_retries=3, retry_backoff=1.5):
         self.session = session
@@ -42,17 +47,6 @@ class ChatGPTAPI:
         - Dict containing response with snapshot_id or direct data (if sync=True)
         """
         url = "https://api.brightdata.com/datasets/v3/scrape" if sync else "https://api.brightdata.com/datasets/v3/trigger"
-        try:
-            from .. import __version__
-            user_agent = f"brightdata-sdk/{__version__}"
-        except ImportError:
-            user_agent = "brightdata-sdk/unknown"
-        
-        headers = {
-            "Authorization": f"Bearer {self.api_token}",
-            "Content-Type": "application/json",
-            "User-Agent": user_agent
-        }
         params = {
             "dataset_id": "gd_m7aof0k82r803d5bjm",
             "include_errors": "true"
@@ -72,7 +66,6 @@ class ChatGPTAPI:
         try:
             response = self.session.post(
                 url, 
-                headers=headers, 
                 params=params, 
                 json=data, 
                 timeout=timeout or (65 if sync else self.default_timeout)
@@ -84,21 +77,7 @@ class ChatGPTAPI:
                 raise APIError(f"ChatGPT scraping request failed with status {response.status_code}: {response.text}")
             
             if sync:
-                response_text = response.text
-                if '\n{' in response_text and response_text.strip().startswith('{'):
-                    json_objects = []
-                    for line in response_text.strip().split('\n'):
-                        if line.strip():
-                            try:
-                                json_objects.append(json.loads(line))
-                            except json.JSONDecodeError:
-                                continue
-                    result = json_objects
-                else:
-                    try:
-                        result = response.json()
-                    except json.JSONDecodeError:
-                        result = response_text
+                result = parse_dataset_response(response)
                 
                 logger.info(f"ChatGPT data retrieved synchronously for {len(prompts)} prompt(s)")
                 print(f"Retrieved {len(result) if isinstance(result, list) else 1} ChatGPT response(s)")
@@ -107,10 +86,7 @@ class ChatGPTAPI:
                 snapshot_id = result.get('snapshot_id')
                 if snapshot_id:
                     logger.info(f"ChatGPT scraping job initiated successfully for {len(prompts)} prompt(s)")
-                    print("")
-                    print("Snapshot ID:")
-                    print(snapshot_id)
-                    print("")
+                    print(f"\nSnapshot ID:\n{snapshot_id}\n")
             
             return result
             
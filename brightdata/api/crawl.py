@@ -1,4 +1,3 @@
-import json
 from typing import Union, Dict, Any, List, Optional
 from ..utils import get_logger, validate_url
 from ..exceptions import ValidationError, APIError, AuthenticationError
@@ -17,6 +16,8 @@ class CrawlAPI:
         "error", "error_code", "warning", "warning_code"
     ]
     
+    _OUTPUT_FIELDS_LOOKUP = frozenset(AVAILABLE_OUTPUT_FIELDS)
+    
     def __init__(self, session, api_token, default_timeout=30, max_retries=3, retry_backoff=1.5):
         self.session = session
         self.api_token = api_token
@@ -98,7 +99,7 @@ class CrawlAPI:
             if not isinstance(custom_output_fields, list):
                 raise ValidationError("custom_output_fields must be a list")
             
-            invalid_fields = [field for field in custom_output_fields if field not in self.AVAILABLE_OUTPUT_FIELDS]
+            invalid_fields = [field for field in custom_output_fields if field not in self._OUTPUT_FIELDS_LOOKUP]
             if invalid_fields:
                 raise ValidationError(f"Invalid output fields: {invalid_fields}. Available fields: {self.AVAILABLE_OUTPUT_FIELDS}")
         
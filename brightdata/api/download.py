@@ -1,16 +1,74 @@
 import json
+import math
 import requests
-from datetime import datetime
+import time
 from typing import Union, Dict, Any, List
 
-from ..utils import get_logger
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from ..utils import get_logger, parse_dataset_response
 from ..exceptions import ValidationError, APIError, AuthenticationError
 
 logger = get_logger('api.download')
 
 
+def _has_non_finite_float(data: Any) -> bool:
+    """Return True if data contains NaN or +/-Infinity anywhere"""
+    if isinstance(data, float):
+        return not math.isfinite(data)
+    if isinstance(data, dict):
+        return any(_has_non_finite_float(value) for value in data.values())
+    if isinstance(data, (list, tuple)):
+        return any(_has_non_finite_float(item) for item in data)
+    return False
+
+
+def _dumps_json(data: Any) -> bytes:
+    """
+    Serialize data as indented UTF-8 JSON, using orjson when it is installed
+    
+    orjson writes NaN and Infinity as null, so data holding them goes through
+    json instead to keep the values. orjson also formats some floats
+    differently (1e20 rather than 1e+20); both parse to the same number.
+    """
+    if orjson is not None and not _has_non_finite_float(data):
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _write_json_file(filename: str, data: Union[Dict, List]) -> None:
+    """
+    Write data to filename as indented JSON
+    
+    Top-level lists are written one item at a time so the whole document
+    is never held in memory as a single string.
+    """
+    with open(filename, 'wb') as f:
+        if not isinstance(data, list) or not data:
+            f.write(_dumps_json(data))
+            return
+        
+        f.write(b'[\n')
+        for index, item in enumerate(data):
+            if index:
+                f.write(b',\n')
+            f.write(b'  ' + _dumps_json(item).replace(b'\n', b'\n  '))
+        f.write(b'\n]')
+
+
 class DownloadAPI:
-    """Handles snapshot and content download operations using Bright Data's download API"""
+    """
+    Handles snapshot and content download operations using Bright Data's download API
+    
+    Authentication comes from the session's Authorization header, which bdclient
+    sets once for all APIs; api_token is not read.
+    """
     
     def __init__(self, session, api_token, default_timeout=30):
         self.session = session
@@ -32,7 +90,7 @@ class DownloadAPI:
         """
         
         if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
             filename = f"brightdata_results_{timestamp}.{format}"
         
         if not filename.endswith(f".{format}"):
@@ -42,12 +100,8 @@ class DownloadAPI:
             content = self._parse_body_json(content)
         
         try:
-            if format == "json":
-                with open(filename, 'w', encoding='utf-8') as f:
-                    if isinstance(content, dict) or isinstance(content, list):
-                        json.dump(content, f, indent=2, ensure_ascii=False)
-                    else:
-                        f.write(str(content))
+            if format == "json" and isinstance(content, (dict, list)):
+                _write_json_file(filename, content)
             else:
                 with open(filename, 'w', encoding='utf-8') as f:
                     f.write(str(content))
@@ -125,17 +179,7 @@ class DownloadAPI:
                 raise ValidationError("Part parameter requires batch_size to be specified")
         
         url = f"https://api.brightdata.com/datasets/v3/snapshot/{snapshot_id}"
-        try:
-            from .. import __version__
-            user_agent = f"brightdata-sdk/{__version__}"
-        except ImportError:
-            user_agent = "brightdata-sdk/unknown"
-        
-        headers = {
-            "Authorization": f"Bearer {self.api_token}",
-            "Accept": "application/json",
-            "User-Agent": user_agent
-        }
+        headers = {"Accept": "application/json"}
         params = {
             "format": format
         }
@@ -181,24 +225,8 @@ class DownloadAPI:
                 data = response.text
                 save_data = data
             else:
-                response_text = response.text
-                if '\n{' in response_text and response_text.strip().startswith('{'):
-                    json_objects = []
-                    for line in response_text.strip().split('\n'):
-                        if line.strip():
-                            try:
-                                json_objects.append(json.loads(line))
-                            except json.JSONDecodeError:
-                                continue
-                    data = json_objects
-                    save_data = json_objects
-                else:
-                    try:
-                        data = response.json()
-                        save_data = data
-                    except json.JSONDecodeError:
-                        data = response_text
-                        save_data = response_text
+                data = parse_dataset_response(response)
+                save_data = data
             
             try:
                 output_file = f"snapshot_{snapshot_id}.{format}"
@@ -206,8 +234,7 @@ class DownloadAPI:
                     with open(output_file, 'w', encoding='utf-8') as f:
                         f.write(str(save_data))
                 else:
-                    with open(output_file, 'w', encoding='utf-8') as f:
-                        json.dump(save_data, f, indent=2, ensure_ascii=False)
+                    _write_json_file(output_file, save_data)
                 logger.info(f"Data saved to: {output_file}")
             except Exception:
                 pass
@@ -1,13 +1,14 @@
 import os
 import re
-import json
-import openai
-from typing import Dict, Any, Tuple, Union, List
+from typing import TYPE_CHECKING, Dict, Any, Tuple, Union, List
 from urllib.parse import urlparse
 
 from ..utils import get_logger
 from ..exceptions import ValidationError, APIError
 
+if TYPE_CHECKING:
+    import openai
+
 logger = get_logger('api.extract')
 
 
@@ -52,6 +53,7 @@ class ExtractAPI:
     
     def __init__(self, client):
         self.client = client
+        self._llm_clients = {}
     
     def extract(self, query: str, url: Union[str, List[str]] = None, output_scheme: Dict[str, Any] = None, llm_key: str = None) -> Dict[str, Any]:
         """
@@ -313,25 +315,43 @@ class ExtractAPI:
             if "additionalProperties" not in schema or schema["additionalProperties"] is not False:
                 raise ValidationError(f"Object schema at '{path}' must have 'additionalProperties': false (OpenAI Structured Outputs requirement)")
                 
-            properties = set(schema["properties"].keys())
+            schema_properties = schema["properties"]
+            properties = set(schema_properties)
             required = set(schema["required"])
             if properties != required:
                 missing = properties - required
                 extra = required - properties
-                error_msg = f"OpenAI Structured Outputs requires ALL properties to be in 'required' array at '{path}'."
+                error_parts = [f"OpenAI Structured Outputs requires ALL properties to be in 'required' array at '{path}'."]
                 if missing:
-                    error_msg += f" Missing from required: {list(missing)}"
+                    error_parts.append(f"Missing from required: {list(missing)}")
                 if extra:
-                    error_msg += f" Extra in required: {list(extra)}"
-                raise ValidationError(error_msg)
+                    error_parts.append(f"Extra in required: {list(extra)}")
+                raise ValidationError(" ".join(error_parts))
                 
-            for prop_name, prop_schema in schema["properties"].items():
+            for prop_name, prop_schema in schema_properties.items():
                 self._validate_structured_outputs_schema(prop_schema, f"{path}.{prop_name}")
                 
         elif schema_type == "array":
             if "items" in schema:
                 self._validate_structured_outputs_schema(schema["items"], f"{path}[]")
     
+    def _get_llm_client(self, llm_key: str) -> "openai.OpenAI":
+        """
+        Return the OpenAI client for an API key, creating it on first use
+        
+        Args:
+            llm_key: OpenAI API key
+            
+        Returns:
+            OpenAI client reused across extract calls with the same key
+        """
+        llm_client = self._llm_clients.get(llm_key)
+        if llm_client is None:
+            import openai
+            llm_client = openai.OpenAI(api_key=llm_key)
+            self._llm_clients[llm_key] = llm_client
+        return llm_client
+    
     def _process_with_llm(self, query: str, content: str, llm_key: str, source_url: str, output_scheme: Dict[str, Any] = None) -> Tuple[str, Dict[str, int]]:
         """
         Process scraped content with OpenAI to extract requested information
@@ -353,7 +373,7 @@ class ExtractAPI:
         elif len(content) > 12000:
             content = content[:12000] + "\n\n... [content truncated to optimize tokens]"
         
-        client = openai.OpenAI(api_key=llm_key)
+        client = self._get_llm_client(llm_key)
         
         system_prompt = f"""You are a precise web content extraction specialist. Your task: {query}
 
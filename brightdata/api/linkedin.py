@@ -3,14 +3,19 @@ import re
 import requests
 from typing import Union, Dict, Any, List
 
-from ..utils import get_logger
+from ..utils import get_logger, parse_dataset_response
 from ..exceptions import ValidationError, APIError, AuthenticationError
 
 logger = get_logger('api.linkedin')
 
 
 class LinkedInAPI:
-    """Handles LinkedIn data collection using Bright Data's collect API"""
+    """
+    Handles LinkedIn data collection using Bright Data's collect API
+    
+    The session must already carry the Authorization header (bdclient sets
+    it); api_token is not read.
+    """
     
     DATASET_IDS = {
         'profile': 'gd_l1viktl72bvl7bjuj0',
@@ -96,18 +101,6 @@ class LinkedInAPI:
         
         logger.info(f"Processing {len(url_list)} LinkedIn {dataset_type} URL(s) {'synchronously' if sync else 'asynchronously'}")
         
-        try:
-            from .. import __version__
-            user_agent = f"brightdata-sdk/{__version__}"
-        except ImportError:
-            user_agent = "brightdata-sdk/unknown"
-        
-        headers = {
-            "Authorization": f"Bearer {self.api_token}",
-            "Content-Type": "application/json",
-            "User-Agent": user_agent
-        }
-        
         if sync:
             api_url = "https://api.brightdata.com/datasets/v3/scrape"
             data = {
@@ -130,7 +123,6 @@ class LinkedInAPI:
             if sync:
                 response = self.session.post(
                     api_url,
-                    headers=headers,
                     params=params,
                     json=data,
                     timeout=timeout or 65
@@ -138,7 +130,6 @@ class LinkedInAPI:
             else:
                 response = self.session.post(
                     api_url,
-                    headers=headers,
                     params=params,
                     json=data,
                     timeout=timeout or self.default_timeout
@@ -150,21 +141,7 @@ class LinkedInAPI:
                 raise APIError(f"LinkedIn data collection request failed with status {response.status_code}: {response.text}")
             
             if sync:
-                response_text = response.text
-                if '\n{' in response_text and response_text.strip().startswith('{'):
-                    json_objects = []
-                    for line in response_text.strip().split('\n'):
-                        if line.strip():
-                            try:
-                                json_objects.append(json.loads(line))
-                            except json.JSONDecodeError:
-                                continue
-                    result = json_objects
-                else:
-                    try:
-                        result = response.json()
-                    except json.JSONDecodeError:
-                        result = response_text
+                result = parse_dataset_response(response)
                 
                 logger.info(f"LinkedIn {dataset_type} data retrieved synchronously for {len(url_list)} URL(s)")
                 print(f"Retrieved {len(result) if isinstance(result, list) else 1} LinkedIn {dataset_type} record(s)")
@@ -173,10 +150,7 @@ class LinkedInAPI:
                 snapshot_id = result.get('snapshot_id')
                 if snapshot_id:
                     logger.info(f"LinkedIn {dataset_type} data collection job initiated successfully for {len(url_list)} URL(s)")
-                    print("")
-                    print("Snapshot ID:")
-                    print(snapshot_id)
-                    print("")
+                    print(f"\nSnapshot ID:\n{snapshot_id}\n")
             
             return result
             
@@ -418,17 +392,6 @@ class LinkedInSearcher:
         
         api_url = "https://api.brightdata.com/datasets/v3/trigger"
             
-        try:
-            from .. import __version__
-            user_agent = f"brightdata-sdk/{__version__}"
-        except ImportError:
-            user_agent = "brightdata-sdk/unknown"
-        
-        headers = {
-            "Authorization": f"Bearer {self.linkedin_api.api_token}",
-            "Content-Type": "application/json",
-            "User-Agent": user_agent
-        }
         params = {
             "dataset_id": self.linkedin_api.DATASET_IDS['profile'],
             "include_errors": "true",
@@ -444,7 +407,7 @@ class LinkedInSearcher:
             for i in range(len(first_names))
         ]
         
-        return self._make_request(api_url, headers, params, data, 'profile search', len(data), timeout)
+        return self._make_request(api_url, params, data, 'profile search', len(data), timeout)
     
     def jobs(
         self,
@@ -576,17 +539,6 @@ class LinkedInSearcher:
         
         api_url = "https://api.brightdata.com/datasets/v3/trigger"
             
-        try:
-            from .. import __version__
-            user_agent = f"brightdata-sdk/{__version__}"
-        except ImportError:
-            user_agent = "brightdata-sdk/unknown"
-        
-        headers = {
-            "Authorization": f"Bearer {self.linkedin_api.api_token}",
-            "Content-Type": "application/json",
-            "User-Agent": user_agent
-        }
         params = {
             "dataset_id": self.linkedin_api.DATASET_IDS['job'],
             "include_errors": "true",
@@ -595,7 +547,7 @@ class LinkedInSearcher:
         }
         
         data = [{"url": url} for url in url_list]
-        return self._make_request(api_url, headers, params, data, 'job search by URL', len(data), timeout)
+        return self._make_request(api_url, params, data, 'job search by URL', len(data), timeout)
     
     def _search_jobs_by_keyword(self, location, keyword, country, time_range, job_type, experience_level, remote, company, location_radius, selective_search, timeout):
         """Search jobs by keyword criteria"""
@@ -621,17 +573,6 @@ class LinkedInSearcher:
         
         api_url = "https://api.brightdata.com/datasets/v3/trigger"
             
-        try:
-            from .. import __version__
-            user_agent = f"brightdata-sdk/{__version__}"
-        except ImportError:
-            user_agent = "brightdata-sdk/unknown"
-        
-        headers = {
-            "Authorization": f"Bearer {self.linkedin_api.api_token}",
-            "Content-Type": "application/json",
-            "User-Agent": user_agent
-        }
         params = {
             "dataset_id": self.linkedin_api.DATASET_IDS['job'],
             "include_errors": "true",
@@ -654,7 +595,7 @@ class LinkedInSearcher:
                 "selective_search": normalized_params['selective_search'][i]
             })
         
-        return self._make_request(api_url, headers, params, data, 'job search by keyword', len(data), timeout)
+        return self._make_request(api_url, params, data, 'job search by keyword', len(data), timeout)
     
     def _search_posts_by_profile(self, profile_urls, start_dates, end_dates, timeout):
         """Search posts by profile URL with optional date filtering"""
@@ -662,30 +603,20 @@ class LinkedInSearcher:
             url_list = [profile_urls]
         else:
             url_list = profile_urls
+        url_count = len(url_list)
             
         if isinstance(start_dates, str):
-            start_list = [start_dates] * len(url_list)
+            start_list = [start_dates] * url_count
         else:
-            start_list = start_dates if len(start_dates) == len(url_list) else [start_dates[0]] * len(url_list)
+            start_list = start_dates if len(start_dates) == url_count else [start_dates[0]] * url_count
             
         if isinstance(end_dates, str):
-            end_list = [end_dates] * len(url_list)
+            end_list = [end_dates] * url_count
         else:
-            end_list = end_dates if len(end_dates) == len(url_list) else [end_dates[0]] * len(url_list)
+            end_list = end_dates if len(end_dates) == url_count else [end_dates[0]] * url_count
         
         api_url = "https://api.brightdata.com/datasets/v3/trigger"
             
-        try:
-            from .. import __version__
-            user_agent = f"brightdata-sdk/{__version__}"
-        except ImportError:
-            user_agent = "brightdata-sdk/unknown"
-        
-        headers = {
-            "Authorization": f"Bearer {self.linkedin_api.api_token}",
-            "Content-Type": "application/json",
-            "User-Agent": user_agent
-        }
         params = {
             "dataset_id": self.linkedin_api.DATASET_IDS['post'],
             "include_errors": "true",
@@ -694,7 +625,7 @@ class LinkedInSearcher:
         }
         
         data = []
-        for i in range(len(url_list)):
+        for i in range(url_count):
             item = {"url": url_list[i]}
             if start_list[i]:
                 item["start_date"] = start_list[i]
@@ -702,7 +633,7 @@ class LinkedInSearcher:
                 item["end_date"] = end_list[i]
             data.append(item)
         
-        return self._make_request(api_url, headers, params, data, 'post search by profile', len(data), timeout)
+        return self._make_request(api_url, params, data, 'post search by profile', len(data), timeout)
     
     def _search_posts_by_company(self, company_urls, timeout):
         """Search posts by company URL"""
@@ -713,17 +644,6 @@ class LinkedInSearcher:
         
         api_url = "https://api.brightdata.com/datasets/v3/trigger"
             
-        try:
-            from .. import __version__
-            user_agent = f"brightdata-sdk/{__version__}"
-        except ImportError:
-            user_agent = "brightdata-sdk/unknown"
-        
-        headers = {
-            "Authorization": f"Bearer {self.linkedin_api.api_token}",
-            "Content-Type": "application/json",
-            "User-Agent": user_agent
-        }
         params = {
             "dataset_id": self.linkedin_api.DATASET_IDS['post'],
             "include_errors": "true",
@@ -732,7 +652,7 @@ class LinkedInSearcher:
         }
         
         data = [{"url": url} for url in url_list]
-        return self._make_request(api_url, headers, params, data, 'post search by company', len(data), timeout)
+        return self._make_request(api_url, params, data, 'post search by company', len(data), timeout)
     
     def _search_posts_by_url(self, urls, timeout):
         """Search posts by general URL"""
@@ -743,17 +663,6 @@ class LinkedInSearcher:
         
         api_url = "https://api.brightdata.com/datasets/v3/trigger"
             
-        try:
-            from .. import __version__
-            user_agent = f"brightdata-sdk/{__version__}"
-        except ImportError:
-            user_agent = "brightdata-sdk/unknown"
-        
-        headers = {
-            "Authorization": f"Bearer {self.linkedin_api.api_token}",
-            "Content-Type": "application/json",
-            "User-Agent": user_agent
-        }
         params = {
             "dataset_id": self.linkedin_api.DATASET_IDS['post'],
             "include_errors": "true",
@@ -762,14 +671,13 @@ class LinkedInSearcher:
         }
         
         data = [{"url": url} for url in url_list]
-        return self._make_request(api_url, headers, params, data, 'post search by URL', len(data), timeout)
+        return self._make_request(api_url, params, data, 'post search by URL', len(data), timeout)
     
-    def _make_request(self, api_url, headers, params, data, operation_type, count, timeout):
+    def _make_request(self, api_url, params, data, operation_type, count, timeout):
         """Common method to make API requests (async only for search operations)"""
         try:
             response = self.linkedin_api.session.post(
                 api_url,
-                headers=headers,
                 params=params,
                 json=data,
                 timeout=timeout or self.linkedin_api.default_timeout
@@ -784,10 +692,7 @@ class LinkedInSearcher:
             snapshot_id = result.get('snapshot_id')
             if snapshot_id:
                 logger.info(f"LinkedIn {operation_type} job initiated successfully for {count} item(s)")
-                print("")
-                print("Snapshot ID:")
-                print(snapshot_id)
-                print("")
+                print(f"\nSnapshot ID:\n{snapshot_id}\n")
             
             return result
             
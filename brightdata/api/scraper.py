@@ -5,15 +5,17 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from ..utils import (
     validate_url, validate_zone_name, validate_country_code,
     validate_timeout, validate_max_workers, validate_url_list,
-    validate_response_format, validate_http_method, retry_request,
-    get_logger, log_request, safe_json_parse, validate_response_size
+    validate_response_format, validate_http_method,
+    get_logger, log_request, safe_json_parse, validate_response_size,
+    raise_for_api_status
 )
-from ..exceptions import ValidationError, APIError, AuthenticationError
+from ..utils.retry import RetryingPostMixin
+from ..exceptions import APIError
 
 logger = get_logger('api.scraper')
 
 
-class WebScraper:
+class WebScraper(RetryingPostMixin):
     """Handles web scraping operations using Bright Data Web Unlocker API"""
     
     def __init__(self, session, default_timeout=30, max_retries=3, retry_backoff=1.5):
@@ -108,6 +110,8 @@ class WebScraper:
                         result = future.result()
                         results[index] = result
                     except Exception as e:
+                        for pending in future_to_index:
+                            pending.cancel()
                         raise APIError(f"Failed to scrape {url[index]}: {str(e)}")
             
             return results
@@ -133,7 +137,7 @@ class WebScraper:
         Perform a single scrape operation with comprehensive logging
         """
         endpoint = "https://api.brightdata.com/request"
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         logger.info(f"Starting scrape request for URL: {url[:100]}{'...' if len(url) > 100 else ''}")
         
@@ -149,57 +153,36 @@ class WebScraper:
         if async_request:
             params['async'] = 'true'
         
-        @retry_request(
-            max_retries=self.max_retries,
-            backoff_factor=self.retry_backoff,
-            retry_statuses={429, 500, 502, 503, 504}
-        )
-        def make_request():
-            return self.session.post(
+        try:
+            response = self._post_with_retry(
                 endpoint,
                 json=payload,
                 params=params,
                 timeout=timeout
             )
+        except Exception as e:
+            response_time = (time.perf_counter_ns() - start_time) / 1_000_000
+            logger.error(f"Request failed after {response_time:.2f}ms for URL {url}: {str(e)}", exc_info=True)
+            raise
         
-        try:
-            response = make_request()
-            response_time = (time.time() - start_time) * 1000
+        response_time = (time.perf_counter_ns() - start_time) / 1_000_000
+        
+        # Log request details
+        log_request(logger, 'POST', endpoint, response.status_code, response_time)
+        
+        if response.status_code == 200:
+            logger.info(f"Scrape completed successfully in {response_time:.2f}ms")
             
-            # Log request details
-            log_request(logger, 'POST', endpoint, response.status_code, response_time)
+            validate_response_size(response.text)
             
-            if response.status_code == 200:
-                logger.info(f"Scrape completed successfully in {response_time:.2f}ms")
-                
-                validate_response_size(response.text)
-                
-                if response_format == "json":
-                    result = safe_json_parse(response.text)
-                    logger.debug(f"Processed response with {len(str(result))} characters")
-                    return result
-                else:
-                    logger.debug(f"Returning raw response with {len(response.text)} characters")
-                    return response.text
-                    
-            elif response.status_code == 400:
-                logger.error(f"Bad Request (400) for URL {url}: {response.text}")
-                raise ValidationError(f"Bad Request (400): {response.text}")
-            elif response.status_code == 401:
-                logger.error(f"Unauthorized (401) for URL {url}: Check API token")
-                raise AuthenticationError(f"Unauthorized (401): Check your API token. {response.text}")
-            elif response.status_code == 403:
-                logger.error(f"Forbidden (403) for URL {url}: Insufficient permissions")
-                raise AuthenticationError(f"Forbidden (403): Insufficient permissions. {response.text}")
-            elif response.status_code == 404:
-                logger.error(f"Not Found (404) for URL {url}: {response.text}")
-                raise APIError(f"Not Found (404): {response.text}")
+            if response_format == "json":
+                result = safe_json_parse(response.text)
+                logger.debug(f"Processed response with {len(str(result))} characters")
+                return result
             else:
-                logger.error(f"API Error ({response.status_code}) for URL {url}: {response.text}")
-                raise APIError(f"API Error ({response.status_code}): {response.text}", 
-                              status_code=response.status_code, response_text=response.text)
-        
-        except Exception as e:
-            response_time = (time.time() - start_time) * 1000
-            logger.error(f"Request failed after {response_time:.2f}ms for URL {url}: {str(e)}", exc_info=True)
-            raise
\ No newline at end of file
+                logger.debug(f"Returning raw response with {len(response.text)} characters")
+                return response.text
+                
+        else:
+            logger.error(f"API Error ({response.status_code}) for URL {url}: {response.text}")
+            raise_for_api_status(response)
\ No newline at end of file
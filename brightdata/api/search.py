@@ -1,5 +1,4 @@
 import json
-import time
 from typing import Union, Dict, Any, List
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import quote_plus
@@ -7,17 +6,24 @@ from urllib.parse import quote_plus
 from ..utils import (
     validate_zone_name, validate_country_code, validate_timeout,
     validate_max_workers, validate_search_engine, validate_query,
-    validate_response_format, validate_http_method, retry_request,
-    get_logger, log_request, safe_json_parse, validate_response_size
+    validate_response_format, validate_http_method,
+    get_logger, raise_for_api_status
 )
-from ..exceptions import ValidationError, APIError, AuthenticationError
+from ..utils.retry import RetryingPostMixin
+from ..exceptions import APIError
 
 logger = get_logger('api.search')
 
 
-class SearchAPI:
+class SearchAPI(RetryingPostMixin):
     """Handles search operations using Bright Data SERP API"""
     
+    BASE_URLS = {
+        "google": "https://www.google.com/search?q=",
+        "bing": "https://www.bing.com/search?q=",
+        "yandex": "https://yandex.com/search/?text="
+    }
+    
     def __init__(self, session, default_timeout=30, max_retries=3, retry_backoff=1.5):
         self.session = session
         self.default_timeout = default_timeout
@@ -101,13 +107,7 @@ class SearchAPI:
         validate_timeout(timeout)
         validate_max_workers(max_workers)
         
-        base_url_map = {
-            "google": "https://www.google.com/search?q=",
-            "bing": "https://www.bing.com/search?q=",
-            "yandex": "https://yandex.com/search/?text="
-        }
-        
-        base_url = base_url_map[search_engine.lower()]
+        base_url = self.BASE_URLS[search_engine.strip().lower()]
         
         if isinstance(query, list):
             effective_max_workers = min(len(query), max_workers or 10)
@@ -129,6 +129,8 @@ class SearchAPI:
                         result = future.result()
                         results[index] = result
                     except Exception as e:
+                        for pending in future_to_index:
+                            pending.cancel()
                         raise APIError(f"Failed to search '{query[index]}': {str(e)}")
             
             return results
@@ -174,20 +176,12 @@ class SearchAPI:
         if async_request:
             params['async'] = 'true'
         
-        @retry_request(
-            max_retries=self.max_retries,
-            backoff_factor=self.retry_backoff,
-            retry_statuses={429, 500, 502, 503, 504}
+        response = self._post_with_retry(
+            endpoint,
+            json=payload,
+            params=params,
+            timeout=timeout
         )
-        def make_request():
-            return self.session.post(
-                endpoint,
-                json=payload,
-                params=params,
-                timeout=timeout
-            )
-        
-        response = make_request()
         
         if response.status_code == 200:
             if response_format == "json":
@@ -199,14 +193,5 @@ class SearchAPI:
             else:
                 return response.text
                 
-        elif response.status_code == 400:
-            raise ValidationError(f"Bad Request (400): {response.text}")
-        elif response.status_code == 401:
-            raise AuthenticationError(f"Unauthorized (401): Check your API token. {response.text}")
-        elif response.status_code == 403:
-            raise AuthenticationError(f"Forbidden (403): Insufficient permissions. {response.text}")
-        elif response.status_code == 404:
-            raise APIError(f"Not Found (404): {response.text}")
         else:
-            raise APIError(f"API Error ({response.status_code}): {response.text}",
-                          status_code=response.status_code, response_text=response.text)
\ No newline at end of file
+            raise_for_api_status(response)
\ No newline at end of file
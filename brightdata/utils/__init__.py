@@ -7,7 +7,10 @@ from .validation import (
 from .retry import retry_request
 from .zone_manager import ZoneManager
 from .logging_config import setup_logging, get_logger, log_request
-from .response_validator import safe_json_parse, validate_response_size, check_response_not_empty
+from .response_validator import (
+    safe_json_parse, validate_response_size, check_response_not_empty,
+    raise_for_api_status, parse_dataset_response
+)
 from .parser import parse_content, parse_multiple, extract_structured_data
 
 __all__ = [
@@ -29,6 +32,8 @@ __all__ = [
     'safe_json_parse',
     'validate_response_size',
     'check_response_not_empty',
+    'raise_for_api_status',
+    'parse_dataset_response',
     'parse_content',
     'parse_multiple',
     'extract_structured_data'
@@ -3,11 +3,17 @@ Structured logging configuration for Bright Data SDK
 """
 import logging
 import json
+import re
 import time
 from typing import Dict, Any
+from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
 import uuid
 
 
+_SENSITIVE_KEYS = ('authorization', 'token', 'api_token', 'password', 'secret')
+_SENSITIVE_KEY_PATTERN = re.compile('|'.join(map(re.escape, _SENSITIVE_KEYS)), re.IGNORECASE)
+
+
 class StructuredFormatter(logging.Formatter):
     """Custom formatter that outputs structured JSON logs"""
     
@@ -52,10 +58,8 @@ class StructuredFormatter(logging.Formatter):
     
     def _sanitize_log_data(self, log_data: Dict[str, Any]) -> Dict[str, Any]:
         """Remove or mask sensitive information from log data"""
-        sensitive_keys = ['authorization', 'token', 'api_token', 'password', 'secret']
-        
         def sanitize_value(key: str, value: Any) -> Any:
-            if isinstance(key, str) and any(sensitive in key.lower() for sensitive in sensitive_keys):
+            if isinstance(key, str) and _SENSITIVE_KEY_PATTERN.search(key):
                 return "***REDACTED***"
             elif isinstance(value, str) and len(value) > 20:
                 if value.isalnum() and len(value) > 32:
@@ -136,9 +140,10 @@ def log_request(logger: logging.Logger, method: str, url: str,
         response_time: Response time in milliseconds
         correlation_id: Request correlation ID
     """
+    sanitized_url = _sanitize_url(url)
     extra = {
         'method': method,
-        'url': _sanitize_url(url),
+        'url': sanitized_url,
         'correlation_id': correlation_id or str(uuid.uuid4())
     }
     
@@ -148,16 +153,14 @@ def log_request(logger: logging.Logger, method: str, url: str,
         extra['response_time'] = response_time
     
     if status_code and status_code >= 400:
-        logger.error(f"HTTP request failed: {method} {_sanitize_url(url)}", extra=extra)
+        logger.error(f"HTTP request failed: {method} {sanitized_url}", extra=extra)
     else:
-        logger.info(f"HTTP request: {method} {_sanitize_url(url)}", extra=extra)
+        logger.info(f"HTTP request: {method} {sanitized_url}", extra=extra)
 
 
 def _sanitize_url(url: str) -> str:
     """Sanitize URL to remove sensitive query parameters"""
     try:
-        from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
-        
         parsed = urlparse(url)
         query_params = parse_qs(parsed.query)
         
@@ -4,10 +4,11 @@ Content parsing utilities for Bright Data SDK responses
 Provides functions to extract and parse content from scraping and search results.
 """
 import json
-import re
-from typing import Any, Dict, List, Union, Optional
+from typing import Any, Dict, List, Tuple, Union, Optional
 
-from bs4 import BeautifulSoup
+_HTML_KEYS = ('html', 'body', 'content', 'page_html', 'raw_html')
+_TITLE_KEYS = ('title', 'page_title', 'name')
+_RESULT_KEYS = frozenset({'html', 'body', 'content', 'page_html', 'raw_html', 'url', 'status_code'})
 
 
 def parse_content(data: Union[str, Dict, List], extract_text: bool = True, extract_links: bool = False, extract_images: bool = False) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
@@ -78,11 +79,11 @@ def _is_multiple_results(data: Union[str, Dict, List]) -> bool:
     
     for item in data[:3]:
         if isinstance(item, dict):
-            common_keys = {'html', 'body', 'content', 'page_html', 'raw_html', 'url', 'status_code'}
-            if any(key in item for key in common_keys):
+            if not _RESULT_KEYS.isdisjoint(item):
                 multiple_result_indicators += 1
         elif isinstance(item, str) and len(item) > 100:
-            if '<html' in item.lower() or '<!doctype' in item.lower():
+            lowered = item.lower()
+            if '<html' in lowered or '<!doctype' in lowered:
                 multiple_result_indicators += 1
     
     return multiple_result_indicators >= 2
@@ -115,11 +116,12 @@ def _parse_single_content(data: Union[str, Dict, List], extract_text: bool = Tru
         result['structured_data'] = data
         result['raw_length'] = len(str(data))
         
-        html_content = _extract_html_from_json(data)
-        if html_content and (extract_text or extract_links or extract_images):
+        wants_html = extract_text or extract_links or extract_images
+        html_content, title = _extract_html_and_title_from_json(data, want_html=wants_html)
+        if html_content:
             _parse_html_content(html_content, result, extract_text, extract_links, extract_images)
         
-        result['title'] = _extract_title_from_json(data)
+        result['title'] = title
     
     elif isinstance(data, str):
         result['type'] = 'html'
@@ -151,6 +153,8 @@ def extract_structured_data(data: Union[str, Dict, List]) -> Optional[Dict]:
     if not html_content:
         return None
     
+    from bs4 import BeautifulSoup
+    
     try:
         soup = BeautifulSoup(html_content, 'html.parser')
         
@@ -174,54 +178,64 @@ def extract_structured_data(data: Union[str, Dict, List]) -> Optional[Dict]:
 
 def _extract_html_from_json(data: Union[Dict, List]) -> Optional[str]:
     """Extract HTML content from JSON response structure"""
-    if isinstance(data, dict):
-        html_keys = ['html', 'body', 'content', 'page_html', 'raw_html']
-        for key in html_keys:
-            if key in data and isinstance(data[key], str):
-                return data[key]
-        
-        for value in data.values():
-            if isinstance(value, (dict, list)):
-                html = _extract_html_from_json(value)
-                if html:
-                    return html
-                    
-    elif isinstance(data, list):
-        for item in data:
-            if isinstance(item, (dict, list)):
-                html = _extract_html_from_json(item)
-                if html:
-                    return html
-    
-    return None
+    return _extract_html_and_title_from_json(data, want_title=False)[0]
 
 
-def _extract_title_from_json(data: Union[Dict, List]) -> Optional[str]:
-    """Extract title from JSON response structure"""
+def _extract_html_and_title_from_json(data: Union[Dict, List], want_html: bool = True, want_title: bool = True) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Extract HTML content and title from JSON response structure in a single walk
+    
+    Args:
+        data: JSON dict or list to search
+        want_html: Look for HTML content (default: True)
+        want_title: Look for a title (default: True)
+        
+    Returns:
+        Tuple of (html, title); either is None if not found or not requested
+    """
+    html = None
+    title = None
+    
     if isinstance(data, dict):
-        title_keys = ['title', 'page_title', 'name']
-        for key in title_keys:
-            if key in data and isinstance(data[key], str):
-                return data[key].strip()
-                
-        for value in data.values():
-            if isinstance(value, (dict, list)):
-                title = _extract_title_from_json(value)
-                if title:
-                    return title
-                    
+        if want_html:
+            for key in _HTML_KEYS:
+                value = data.get(key)
+                if isinstance(value, str):
+                    html = value
+                    break
+        
+        if want_title:
+            for key in _TITLE_KEYS:
+                value = data.get(key)
+                if isinstance(value, str):
+                    title = value.strip()
+                    break
+        
+        children = data.values()
     elif isinstance(data, list):
-        for item in data:
-            if isinstance(item, (dict, list)):
-                title = _extract_title_from_json(item)
-                if title:
-                    return title
+        children = data
+    else:
+        return html, title
     
-    return None
+    for value in children:
+        need_html = want_html and html is None
+        need_title = want_title and title is None
+        if not (need_html or need_title):
+            break
+        if isinstance(value, (dict, list)):
+            child_html, child_title = _extract_html_and_title_from_json(value, need_html, need_title)
+            if need_html and child_html:
+                html = child_html
+            if need_title and child_title:
+                title = child_title
+    
+    return html, title
 
 
 def _parse_html_content(html: str, result: Dict, extract_text: bool, extract_links: bool, extract_images: bool):
     """Parse HTML content and update result dictionary"""
+    from bs4 import BeautifulSoup
+    
     try:
         soup = BeautifulSoup(html, 'html.parser')
         
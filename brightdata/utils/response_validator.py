@@ -2,8 +2,16 @@
 Minimal response validation utilities for Bright Data SDK
 """
 import json
-from typing import Any, Dict, Union
-from ..exceptions import ValidationError
+from typing import Any, Dict, List, Union
+from ..exceptions import ValidationError, AuthenticationError, APIError
+
+
+_STATUS_ERRORS = {
+    400: (ValidationError, "Bad Request (400): {text}"),
+    401: (AuthenticationError, "Unauthorized (401): Check your API token. {text}"),
+    403: (AuthenticationError, "Forbidden (403): Insufficient permissions. {text}"),
+    404: (APIError, "Not Found (404): {text}"),
+}
 
 
 def safe_json_parse(response_text: str) -> Dict[str, Any]:
@@ -38,6 +46,35 @@ def validate_response_size(response_text: str, max_size_mb: float = 100.0) -> No
         raise ValidationError(f"Response too large (>{max_size_mb}MB)")
 
 
+def parse_dataset_response(response: Any) -> Union[List[Any], Dict[str, Any], str]:
+    """
+    Parse a dataset API response body that may be NDJSON, JSON or plain text
+    
+    Args:
+        response: HTTP response from a dataset endpoint
+        
+    Returns:
+        List of records for NDJSON bodies, parsed JSON otherwise, or the raw
+        text if the body is not JSON
+    """
+    response_text = response.text
+    stripped = response_text.strip()
+    if '\n{' in response_text and stripped.startswith('{'):
+        json_objects = []
+        for line in stripped.split('\n'):
+            if line.strip():
+                try:
+                    json_objects.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+        return json_objects
+    
+    try:
+        return response.json()
+    except json.JSONDecodeError:
+        return response_text
+
+
 def check_response_not_empty(data: Any) -> None:
     """
     Minimal check that response contains data
@@ -46,4 +83,20 @@ def check_response_not_empty(data: Any) -> None:
         data: Response data to check
     """
     if data is None or (isinstance(data, str) and len(data.strip()) == 0):
-        raise ValidationError("Empty response received")
\ No newline at end of file
+        raise ValidationError("Empty response received")
+
+
+def raise_for_api_status(response: Any) -> None:
+    """
+    Raise the SDK exception matching a failed API response
+    
+    Args:
+        response: HTTP response with a non-200 status code
+    """
+    status_code = response.status_code
+    error = _STATUS_ERRORS.get(status_code)
+    if error:
+        error_class, message = error
+        raise error_class(message.format(text=response.text))
+    raise APIError(f"API Error ({status_code}): {response.text}",
+                  status_code=status_code, response_text=response.text)
\ No newline at end of file
@@ -2,7 +2,7 @@ import time
 import random
 import requests
 from functools import wraps
-from ..exceptions import NetworkError, APIError
+from ..exceptions import BrightDataError, NetworkError, APIError
 
 
 def retry_request(max_retries=3, backoff_factor=1.5, retry_statuses=None, max_backoff=60):
@@ -66,6 +66,9 @@ def retry_request(max_retries=3, backoff_factor=1.5, retry_statuses=None, max_ba
                     last_exception = NetworkError(f"Proxy error: {str(e)}")
                 except requests.exceptions.RequestException as e:
                     last_exception = NetworkError(f"Network error: {str(e)}")
+                except BrightDataError:
+                    # SDK errors (e.g. ZoneError on 4xx) are final, not transient
+                    raise
                 except Exception as e:
                     # Catch any other unexpected exceptions
                     last_exception = NetworkError(f"Unexpected error: {str(e)}")
@@ -87,4 +90,33 @@ def retry_request(max_retries=3, backoff_factor=1.5, retry_statuses=None, max_ba
             return None
             
         return wrapper
-    return decorator
\ No newline at end of file
+    return decorator
+
+
+class RetryingPostMixin:
+    """
+    Shared retrying POST for API classes that hold a session, max_retries and retry_backoff
+    
+    The retry wrapper is built once and rebuilt only when max_retries or
+    retry_backoff change, so updating either attribute takes effect on the
+    next request.
+    """
+    
+    _retry_settings = None
+    _retrying_post = None
+    
+    def _post(self, *args, **kwargs):
+        """Send a POST request through the shared session"""
+        return self.session.post(*args, **kwargs)
+    
+    def _post_with_retry(self, *args, **kwargs):
+        """Send a POST request, retrying network errors and retryable status codes"""
+        settings = (self.max_retries, self.retry_backoff)
+        if self._retrying_post is None or self._retry_settings != settings:
+            self._retrying_post = retry_request(
+                max_retries=self.max_retries,
+                backoff_factor=self.retry_backoff,
+                retry_statuses=None
+            )(self._post)
+            self._retry_settings = settings
+        return self._retrying_post(*args, **kwargs)
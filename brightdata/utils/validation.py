@@ -3,6 +3,11 @@ from typing import Union, List
 from ..exceptions import ValidationError
 
 
+_VALID_SEARCH_ENGINES = ('google', 'bing', 'yandex')
+_VALID_RESPONSE_FORMATS = ('json', 'raw')
+_VALID_HTTP_METHODS = ('GET', 'POST', 'PUT', 'DELETE', 'PATCH')
+
+
 def validate_url(url: str) -> None:
     """Validate URL format with comprehensive checks"""
     if not isinstance(url, str):
@@ -129,11 +134,10 @@ def validate_search_engine(search_engine: str) -> None:
     if not isinstance(search_engine, str):
         raise ValidationError(f"Search engine must be a string, got {type(search_engine).__name__}")
     
-    valid_engines = ['google', 'bing', 'yandex']
     search_engine = search_engine.strip().lower()
     
-    if search_engine not in valid_engines:
-        raise ValidationError(f"Invalid search engine '{search_engine}'. Valid options: {', '.join(valid_engines)}")
+    if search_engine not in _VALID_SEARCH_ENGINES:
+        raise ValidationError(f"Invalid search engine '{search_engine}'. Valid options: {', '.join(_VALID_SEARCH_ENGINES)}")
 
 
 def validate_query(query: Union[str, List[str]]) -> None:
@@ -164,11 +168,10 @@ def validate_response_format(response_format: str) -> None:
     if not isinstance(response_format, str):
         raise ValidationError(f"Response format must be a string, got {type(response_format).__name__}")
     
-    valid_formats = ['json', 'raw']
     response_format = response_format.strip().lower()
     
-    if response_format not in valid_formats:
-        raise ValidationError(f"Invalid response format '{response_format}'. Valid options: {', '.join(valid_formats)}")
+    if response_format not in _VALID_RESPONSE_FORMATS:
+        raise ValidationError(f"Invalid response format '{response_format}'. Valid options: {', '.join(_VALID_RESPONSE_FORMATS)}")
 
 
 def validate_http_method(method: str) -> None:
@@ -176,8 +179,7 @@ def validate_http_method(method: str) -> None:
     if not isinstance(method, str):
         raise ValidationError(f"HTTP method must be a string, got {type(method).__name__}")
     
-    valid_methods = ['GET', 'POST', 'PUT', 'DELETE', 'PATCH']
     method = method.strip().upper()
     
-    if method not in valid_methods:
-        raise ValidationError(f"Invalid HTTP method '{method}'. Valid options: {', '.join(valid_methods)}")
\ No newline at end of file
+    if method not in _VALID_HTTP_METHODS:
+        raise ValidationError(f"Invalid HTTP method '{method}'. Valid options: {', '.join(_VALID_HTTP_METHODS)}")
\ No newline at end of file
@@ -1,7 +1,9 @@
 import requests
 import json
+import copy
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from ..exceptions import ZoneError, NetworkError, APIError
 from .retry import retry_request
 
@@ -11,8 +13,14 @@ logger = logging.getLogger(__name__)
 class ZoneManager:
     """Manages Bright Data zones - creation and validation"""
     
+    ZONES_CACHE_TTL = 5
+    
     def __init__(self, session: requests.Session):
         self.session = session
+        self._zones_cache = None
+        self._zones_cache_expires = 0.0
+        self._zones_etag = None
+        self._zones_etag_body = None
     
     def ensure_required_zones(self, web_unlocker_zone: str, serp_zone: str):
         """
@@ -21,7 +29,7 @@ class ZoneManager:
         """
         try:
             logger.info("Checking existing zones...")
-            zones = self._get_zones_with_retry()
+            zones = self._get_zones_cached()
             zone_names = {zone.get('name') for zone in zones}
             logger.info(f"Found {len(zones)} existing zones")
             
@@ -38,11 +46,18 @@ class ZoneManager:
                 logger.info("All required zones already exist")
                 return
                 
-            for zone_name, zone_type in zones_to_create:
-                logger.info(f"Creating zone: {zone_name} (type: {zone_type})")
-                self._create_zone_with_retry(zone_name, zone_type)
-                logger.info(f"Successfully created zone: {zone_name}")
+            with ThreadPoolExecutor(max_workers=len(zones_to_create)) as executor:
+                future_to_zone = {}
+                for zone_name, zone_type in zones_to_create:
+                    logger.info(f"Creating zone: {zone_name} (type: {zone_type})")
+                    future = executor.submit(self._create_zone_with_retry, zone_name, zone_type)
+                    future_to_zone[future] = zone_name
+                
+                for future in as_completed(future_to_zone):
+                    future.result()
+                    logger.info(f"Successfully created zone: {future_to_zone[future]}")
             
+            self._invalidate_zones_cache()
             self._verify_zones_created([zone[0] for zone in zones_to_create])
                 
         except (ZoneError, NetworkError, APIError):
@@ -57,16 +72,45 @@ class ZoneManager:
             logger.error(f"Unexpected error while ensuring zones exist: {e}")
             raise ZoneError(f"Unexpected error during zone creation: {str(e)}")
     
+    def _get_zones_cached(self):
+        """
+        Get zones list, reusing a response fetched within the last ZONES_CACHE_TTL seconds
+        
+        Returns a deep copy on every call so callers cannot alter the cached zones.
+        """
+        now = time.monotonic()
+        if self._zones_cache is None or now >= self._zones_cache_expires:
+            self._zones_cache = self._get_zones_with_retry()
+            self._zones_cache_expires = now + self.ZONES_CACHE_TTL
+        return copy.deepcopy(self._zones_cache)
+    
+    def _invalidate_zones_cache(self):
+        """Drop the cached zones list so the next lookup hits the API"""
+        self._zones_cache = None
+        self._zones_cache_expires = 0.0
+    
     @retry_request(max_retries=3, backoff_factor=1.5, retry_statuses={429, 500, 502, 503, 504})
     def _get_zones_with_retry(self):
-        """Get zones list with retry logic for network issues"""
-        response = self.session.get('https://api.brightdata.com/zone/get_active_zones')
+        """
+        Get zones list with retry logic for network issues
+        
+        Sends the ETag of the last zones response so an unchanged list is
+        answered with 304 Not Modified instead of the full body.
+        """
+        headers = {'If-None-Match': self._zones_etag} if self._zones_etag else None
+        response = self.session.get('https://api.brightdata.com/zone/get_active_zones', headers=headers)
         
-        if response.status_code == 200:
+        if response.status_code == 304 and self._zones_etag_body is not None:
+            logger.debug("Zones list not modified since last request")
+            return copy.deepcopy(self._zones_etag_body)
+        elif response.status_code == 200:
             try:
-                return response.json() or []
+                zones = response.json() or []
             except json.JSONDecodeError as e:
                 raise ZoneError(f"Invalid JSON response from zones API: {str(e)}")
+            self._zones_etag = response.headers.get('ETag')
+            self._zones_etag_body = copy.deepcopy(zones) if self._zones_etag else None
+            return zones
         elif response.status_code == 401:
             raise ZoneError("Unauthorized (401): Check your API token and ensure it has proper permissions")
         elif response.status_code == 403:
@@ -125,11 +169,10 @@ class ZoneManager:
         """
         Verify that zones were successfully created by checking the zones list
         """
-        max_attempts = 3
+        max_attempts = 4
         for attempt in range(max_attempts):
             try:
                 logger.info(f"Verifying zone creation (attempt {attempt + 1}/{max_attempts})")
-                time.sleep(1)
                 
                 zones = self._get_zones_with_retry()
                 existing_zone_names = {zone.get('name') for zone in zones}
@@ -144,6 +187,7 @@ class ZoneManager:
                     raise ZoneError(f"Zone verification failed: zones {missing_zones} not found after creation")
                     
                 logger.warning(f"Zones not yet visible: {missing_zones}. Retrying verification...")
+                time.sleep(1)
                 
             except (ZoneError, NetworkError):
                 if attempt == max_attempts - 1:
@@ -158,15 +202,20 @@ class ZoneManager:
         """
         return self._create_zone_with_retry(zone_name, zone_type)
     
-    def list_zones(self):
+    def list_zones(self, refresh: bool = False):
         """
         List all active zones in your Bright Data account
         
+        Args:
+            refresh: Skip the ZONES_CACHE_TTL cache and fetch the list from the API
+        
         Returns:
             List of zone dictionaries with their configurations
         """
         try:
-            return self._get_zones_with_retry()
+            if refresh:
+                self._invalidate_zones_cache()
+            return self._get_zones_cached()
         except (ZoneError, NetworkError):
             raise
         except Exception as e:
@@ -54,12 +54,15 @@ setup(
     ],
     extras_require={
         "dev": [
-            "pytest>=6.0.0",
+            "pytest>=6.2.0",
             "pytest-cov>=2.10.0",
             "black>=21.0.0",
             "isort>=5.0.0",
             "flake8>=3.8.0",
         ],
+        "fast": [
+            "orjson>=3.6.0",
+        ],
     },
     keywords="brightdata, web scraping, proxy, serp, api, data extraction",
     project_urls={
@@ -16,84 +16,214 @@ All tests are designed to run without requiring real API tokens by:
 """
 
 import pytest
-import os
-from unittest.mock import patch
+import json
+import math
+from unittest.mock import Mock, patch
 
 from brightdata import bdclient
-from brightdata.exceptions import ValidationError
+from brightdata.exceptions import ValidationError, AuthenticationError, BrightDataError, ZoneError
+from brightdata.utils import ZoneManager
+from brightdata.api import SearchAPI
+from brightdata.api.download import _write_json_file
+
+TEST_TOKEN = "valid_test_token_12345678"
+ENV_TOKEN = "valid_env_token_12345678"
+SDK_ENV_VARS = (
+    "BRIGHTDATA_API_TOKEN", "BRIGHTDATA_VERBOSE", "BRIGHTDATA_AUTO_CREATE_ZONES",
+    "WEB_UNLOCKER_ZONE", "SERP_ZONE", "BROWSER_ZONE",
+    "BRIGHTDATA_BROWSER_USERNAME", "BRIGHTDATA_BROWSER_PASSWORD",
+)
+
+
+@pytest.fixture
+def clean_env(monkeypatch):
+    """Remove SDK environment variables so the client falls back to its defaults"""
+    for name in SDK_ENV_VARS:
+        monkeypatch.delenv(name, raising=False)
+    return monkeypatch
+
+
+@pytest.fixture
+def env_client(clean_env):
+    """Create a client configured only through environment variables"""
+    clean_env.setenv("BRIGHTDATA_API_TOKEN", ENV_TOKEN)
+    clean_env.setenv("WEB_UNLOCKER_ZONE", "env_unlocker")
+    clean_env.setenv("SERP_ZONE", "env_serp")
+    return bdclient(auto_create_zones=False)
+
+
+@pytest.fixture(scope="module")
+def client():
+    """Create a test client with default settings, shared by the tests in this module"""
+    with pytest.MonkeyPatch.context() as mp:
+        for name in SDK_ENV_VARS:
+            mp.delenv(name, raising=False)
+        return bdclient(api_token=TEST_TOKEN, auto_create_zones=False)
 
 
 class TestBdClient:
     """Test cases for the main bdclient class"""
     
     @patch('brightdata.utils.zone_manager.ZoneManager.ensure_required_zones')
-    def test_client_init_with_token(self, mock_zones):
+    def test_client_init_with_token(self, mock_zones, clean_env):
         """Test client initialization with API token"""
-        with patch.dict(os.environ, {}, clear=True):
-            client = bdclient(api_token="valid_test_token_12345678", auto_create_zones=False)
-            assert client.api_token == "valid_test_token_12345678"
+        client = bdclient(api_token=TEST_TOKEN, auto_create_zones=False)
+        assert client.api_token == TEST_TOKEN
     
-    @patch('brightdata.utils.zone_manager.ZoneManager.ensure_required_zones')
-    def test_client_init_from_env(self, mock_zones):
+    def test_client_init_from_env(self, env_client):
         """Test client initialization from environment variable"""
-        with patch.dict(os.environ, {"BRIGHTDATA_API_TOKEN": "valid_env_token_12345678"}):
-            client = bdclient(auto_create_zones=False)
-            assert client.api_token == "valid_env_token_12345678"
+        assert env_client.api_token == ENV_TOKEN
     
-    def test_client_init_no_token_raises_error(self):
+    def test_client_init_no_token_raises_error(self, clean_env):
         """Test that missing API token raises ValidationError"""
-        with patch.dict(os.environ, {}, clear=True):
-            with patch('dotenv.load_dotenv'):
-                with pytest.raises(ValidationError, match="API token is required"):
-                    bdclient()
+        with patch('dotenv.load_dotenv'):
+            with pytest.raises(ValidationError, match="API token is required"):
+                bdclient()
     
-    @patch('brightdata.utils.zone_manager.ZoneManager.ensure_required_zones')
-    def test_client_zone_defaults(self, mock_zones):
+    def test_client_zone_defaults(self, client):
         """Test default zone configurations"""
-        with patch.dict(os.environ, {}, clear=True):
-            client = bdclient(api_token="valid_test_token_12345678", auto_create_zones=False)
-            assert client.web_unlocker_zone == "sdk_unlocker"
-            assert client.serp_zone == "sdk_serp"
+        assert client.web_unlocker_zone == "sdk_unlocker"
+        assert client.serp_zone == "sdk_serp"
+    
+    def test_client_zones_from_env(self, env_client):
+        """Test zone names read from environment variables"""
+        assert env_client.web_unlocker_zone == "env_unlocker"
+        assert env_client.serp_zone == "env_serp"
     
     @patch('brightdata.utils.zone_manager.ZoneManager.ensure_required_zones')
-    def test_client_custom_zones(self, mock_zones):
+    def test_client_custom_zones(self, mock_zones, clean_env):
         """Test custom zone configuration"""
-        with patch.dict(os.environ, {}, clear=True):
-            client = bdclient(
-                api_token="valid_test_token_12345678",
-                web_unlocker_zone="custom_unlocker",
-                serp_zone="custom_serp",
-                auto_create_zones=False
-            )
-            assert client.web_unlocker_zone == "custom_unlocker"
-            assert client.serp_zone == "custom_serp"
+        client = bdclient(
+            api_token=TEST_TOKEN,
+            web_unlocker_zone="custom_unlocker",
+            serp_zone="custom_serp",
+            auto_create_zones=False
+        )
+        assert client.web_unlocker_zone == "custom_unlocker"
+        assert client.serp_zone == "custom_serp"
+
+    @pytest.mark.parametrize("value", ["false", "0", "OFF"])
+    @patch('brightdata.utils.zone_manager.ZoneManager.ensure_required_zones')
+    def test_client_auto_create_zones_from_env(self, mock_zones, clean_env, value):
+        """Test that a false-like BRIGHTDATA_AUTO_CREATE_ZONES skips the zone check"""
+        clean_env.setenv("BRIGHTDATA_AUTO_CREATE_ZONES", value)
+        client = bdclient(api_token=TEST_TOKEN)
+        assert client.auto_create_zones is False
+        mock_zones.assert_not_called()
+    
+    @patch('brightdata.utils.zone_manager.ZoneManager.ensure_required_zones')
+    def test_client_auto_create_zones_argument_overrides_env(self, mock_zones, clean_env):
+        """Test that an explicit auto_create_zones=True wins over the environment"""
+        clean_env.setenv("BRIGHTDATA_AUTO_CREATE_ZONES", "false")
+        client = bdclient(api_token=TEST_TOKEN, auto_create_zones=True)
+        assert client.auto_create_zones is True
+        mock_zones.assert_called_once()
+    
+    @patch('brightdata.utils.zone_manager.ZoneManager._get_zones_with_retry')
+    def test_list_zones_reuses_recent_response(self, mock_get_zones, clean_env):
+        """Test that repeated zone listings within the cache TTL hit the API once"""
+        mock_get_zones.return_value = [{"name": "sdk_unlocker"}]
+        client = bdclient(api_token=TEST_TOKEN, auto_create_zones=False)
+        assert client.list_zones() == [{"name": "sdk_unlocker"}]
+        assert client.list_zones() == [{"name": "sdk_unlocker"}]
+        assert mock_get_zones.call_count == 1
+    
+    @patch('brightdata.utils.zone_manager.ZoneManager._get_zones_with_retry')
+    def test_list_zones_refresh_skips_cache(self, mock_get_zones, clean_env):
+        """Test that list_zones(refresh=True) fetches the zones list again"""
+        mock_get_zones.side_effect = [[{"name": "sdk_unlocker"}], [{"name": "new_zone"}]]
+        client = bdclient(api_token=TEST_TOKEN, auto_create_zones=False)
+        assert client.list_zones() == [{"name": "sdk_unlocker"}]
+        assert client.list_zones(refresh=True) == [{"name": "new_zone"}]
+        assert mock_get_zones.call_count == 2
+    
+    @patch('brightdata.utils.zone_manager.ZoneManager._get_zones_with_retry')
+    def test_list_zones_result_changes_do_not_leak_into_cache(self, mock_get_zones, clean_env):
+        """Test that changing a returned zone list does not alter the next cached result"""
+        mock_get_zones.return_value = [{"name": "sdk_unlocker"}]
+        client = bdclient(api_token=TEST_TOKEN, auto_create_zones=False)
+        zones = client.list_zones()
+        zones[0]["name"] = "mutated"
+        zones.append({"name": "bogus"})
+        assert client.list_zones() == [{"name": "sdk_unlocker"}]
+        assert mock_get_zones.call_count == 1
+    
+    def test_zones_not_modified_reuses_previous_body(self):
+        """Test that a 304 zones response returns an unaltered copy of the previously fetched list"""
+        first = Mock(status_code=200, headers={'ETag': '"v1"'})
+        first.json.return_value = [{"name": "sdk_serp"}]
+        second = Mock(status_code=304, headers={})
+        session = Mock()
+        session.get.side_effect = [first, second]
+        
+        zone_manager = ZoneManager(session)
+        zones = zone_manager._get_zones_with_retry()
+        zones[0]["name"] = "mutated"
+        zones.append({"name": "bogus"})
+        assert zone_manager._get_zones_with_retry() == [{"name": "sdk_serp"}]
+        assert session.get.call_args.kwargs['headers'] == {'If-None-Match': '"v1"'}
+    
+    @patch('brightdata.utils.zone_manager.time.sleep')
+    @patch('brightdata.utils.zone_manager.ZoneManager._get_zones_with_retry')
+    def test_verify_zones_backs_off_once_per_failed_attempt(self, mock_get_zones, mock_sleep):
+        """Test that zone verification only sleeps for its backoff after a failed check"""
+        mock_get_zones.side_effect = [ZoneError("boom"), ZoneError("boom"), [], [{"name": "sdk_serp"}]]
+        ZoneManager(Mock())._verify_zones_created(["sdk_serp"])
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [1, 2, 1]
+
+    
+    @staticmethod
+    def _zones_response(zones):
+        response = Mock(status_code=200, headers={})
+        response.json.return_value = zones
+        return response
+    
+    def test_ensure_required_zones_creates_missing_zones(self):
+        """Test that both missing zones are created, the cache is dropped and creation is verified"""
+        session = Mock()
+        session.get.side_effect = [
+            self._zones_response([]),
+            self._zones_response([{"name": "sdk_unlocker"}, {"name": "sdk_serp"}]),
+        ]
+        session.post.return_value = Mock(status_code=201, text="")
+        
+        zone_manager = ZoneManager(session)
+        zone_manager.ensure_required_zones("sdk_unlocker", "sdk_serp")
+        
+        created = {c.kwargs["json"]["zone"]["name"] for c in session.post.call_args_list}
+        assert created == {"sdk_unlocker", "sdk_serp"}
+        assert zone_manager._zones_cache is None
+        assert session.get.call_count == 2
+    
+    @patch('brightdata.utils.retry.time.sleep')
+    def test_ensure_required_zones_creation_failure_raises_zone_error(self, mock_sleep):
+        """Test that a failed zone creation surfaces as ZoneError"""
+        def mock_post(url, json):
+            if json["zone"]["name"] == "sdk_serp":
+                return Mock(status_code=400, text="bad plan")
+            return Mock(status_code=201, text="")
+        
+        session = Mock()
+        session.get.return_value = self._zones_response([])
+        session.post.side_effect = mock_post
+        
+        with pytest.raises(ZoneError, match="Bad request \\(400\\) creating zone 'sdk_serp'"):
+            ZoneManager(session).ensure_required_zones("sdk_unlocker", "sdk_serp")
+        assert session.get.call_count == 1
 
 
 class TestClientMethods:
     """Test cases for client methods with mocked responses"""
     
-    @pytest.fixture
-    @patch('brightdata.utils.zone_manager.ZoneManager.ensure_required_zones')
-    def client(self, mock_zones):
-        """Create a test client with mocked validation"""
-        with patch.dict(os.environ, {}, clear=True):
-            client = bdclient(api_token="valid_test_token_12345678", auto_create_zones=False)
-            return client
-    
-    def test_scrape_single_url_validation(self, client):
-        """Test URL validation in scrape method"""
-        with pytest.raises(ValidationError, match="URL must include a scheme"):
-            client.scrape("not_a_url")
-    
-    def test_search_empty_query_validation(self, client):
-        """Test query validation in search method"""
-        with pytest.raises(ValidationError, match="cannot be empty"):
-            client.search("")
-    
-    def test_search_unsupported_engine(self, client):
-        """Test unsupported search engine validation"""
-        with pytest.raises(ValidationError, match="Invalid search engine"):
-            client.search("test query", search_engine="invalid_engine")
+    @pytest.mark.parametrize("method, args, kwargs, message", [
+        ("scrape", ("not_a_url",), {}, "URL must include a scheme"),
+        ("search", ("",), {}, "cannot be empty"),
+        ("search", ("test query",), {"search_engine": "invalid_engine"}, "Invalid search engine"),
+    ], ids=["scrape_url_scheme", "search_empty_query", "search_unsupported_engine"])
+    def test_input_validation(self, client, method, args, kwargs, message):
+        """Test that invalid scrape/search input raises ValidationError"""
+        with pytest.raises(ValidationError, match=message):
+            getattr(client, method)(*args, **kwargs)
     
     def test_search_with_parse_parameter(self, client, monkeypatch):
         """Test search with parse parameter adds brd_json=1 to URL"""
@@ -102,7 +232,6 @@ class TestClientMethods:
         
         def mock_post(*args, **kwargs):
             captured_request.update(kwargs)
-            from unittest.mock import Mock
             response = Mock()
             response.status_code = 200
             response.text = "mocked html response"
@@ -110,11 +239,61 @@ class TestClientMethods:
         
         monkeypatch.setattr(client.search_api.session, 'post', mock_post)
         
-        result = client.search("test query", parse=True)
+        client.search("test query", parse=True)
         
         # Verify the request was made with correct URL containing &brd_json=1
         request_data = captured_request.get('json', {})
         assert "&brd_json=1" in request_data["url"]
+    
+    def test_search_unauthorized_raises_authentication_error(self, client, monkeypatch):
+        """Test that a 401 response is mapped to AuthenticationError"""
+        def mock_post(*args, **kwargs):
+            response = Mock()
+            response.status_code = 401
+            response.text = "invalid token"
+            return response
+        
+        monkeypatch.setattr(client.search_api.session, 'post', mock_post)
+        
+        with pytest.raises(AuthenticationError, match=r"Unauthorized \(401\)"):
+            client.search("test query")
+    
+    def test_retry_settings_changed_after_construction_take_effect(self):
+        """Test that updating max_retries on an API object applies to the next request"""
+        session = Mock()
+        session.post.return_value = Mock(status_code=503, text="unavailable")
+        search_api = SearchAPI(session, max_retries=3, retry_backoff=1.5)
+        search_api.max_retries = 0
+        
+        with pytest.raises(BrightDataError, match="after 0 retries"):
+            search_api._post_with_retry("https://api.brightdata.com/request", json={})
+        assert session.post.call_count == 1
+
+
+class TestWriteJsonFile:
+    """Test cases for the JSON writer used by downloads"""
+    
+    @pytest.mark.parametrize("data", [
+        [{"name": "first", "tags": ["a", "b"]}, "second\nline", 3, [], {}],
+        {"name": "caf\u00e9", "nested": {"items": [1, 2, {"deep": None}]}},
+        [],
+        [{"id": 1}, 2 ** 70, {"id": 2}],
+    ], ids=["list", "dict", "empty_list", "int_rejected_by_orjson"])
+    def test_write_json_file_round_trips(self, tmp_path, data):
+        """Test that the written file loads back to the input data"""
+        path = tmp_path / "out.json"
+        _write_json_file(str(path), data)
+        with open(path, encoding="utf-8") as f:
+            assert json.load(f) == data
+    
+    def test_write_json_file_keeps_non_finite_floats(self, tmp_path):
+        """Test that NaN and Infinity are written as such instead of null"""
+        path = tmp_path / "out.json"
+        _write_json_file(str(path), [{"score": float("nan")}, float("inf"), 1.5])
+        with open(path, encoding="utf-8") as f:
+            loaded = json.load(f)
+        assert math.isnan(loaded[0]["score"])
+        assert loaded[1:] == [float("inf"), 1.5]
 
 
 if __name__ == "__main__":